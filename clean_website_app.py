@@ -1,12 +1,21 @@
 import sys
 import os
 import re
+import csv
 import json
 import logging
 import subprocess
+import functools
+import multiprocessing
+from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+import numpy as np
 import pandas as pd
-import validators
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 # For better fuzzy matching:
 try:
@@ -16,15 +25,31 @@ except ImportError:
     fuzz = None
     process = None
 
+# For faster Excel reading (Rust parser instead of openpyxl):
+try:
+    import python_calamine  # noqa: F401
+    # pandas only knows engine="calamine" from 2.2 on
+    _PANDAS_VERSION = tuple(int(p) for p in re.findall(r'\d+', pd.__version__)[:2])
+    EXCEL_ENGINE = "calamine" if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    # pip install python-calamine
+    EXCEL_ENGINE = None
+
+# Keywords for auto-detecting columns (already lowercase)
+TITLE_KEYWORDS = ("title", "titel", "titulo", "заголовок", "titolo")
+WEB_KEYWORDS = ("website", "web", "url", "site", "homepage")
+FUZZY_KEYWORDS = TITLE_KEYWORDS + WEB_KEYWORDS
+
 from PyQt6.QtCore import (
     Qt,
     QThread,
     pyqtSignal,
     pyqtSlot,
     QObject,
-    QRect
+    QRect,
+    QTimer
 )
-from PyQt6.QtGui import QDragEnterEvent, QDropEvent
+from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -38,6 +63,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QFileDialog,
     QMessageBox,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QAbstractItemView,
@@ -63,6 +89,11 @@ logging.basicConfig(
 ###############################################################################
 CONFIG_FILE = "config.json"
 
+# Past the core count extra workers only add scheduling overhead
+CPU_COUNT = os.cpu_count() or 4
+DEFAULT_WORKERS = min(CPU_COUNT, 8)
+MAX_WORKERS = max(2, 2 * CPU_COUNT)
+
 def load_config() -> dict:
     if os.path.isfile(CONFIG_FILE):
         try:
@@ -77,7 +108,7 @@ def load_config() -> dict:
         "columnsToValidate": [],
         "lastOutputBaseName": "cleaned_output",
         "windowGeometry": None,
-        "numThreads": 4,
+        "numThreads": DEFAULT_WORKERS,
         "outputDir": ""
     }
 
@@ -92,54 +123,123 @@ def save_config(cfg: dict):
 ###############################################################################
 # VALIDATION
 ###############################################################################
+# scheme + host-ish first char + no whitespace
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+# _URL_RE spelled out for RE2 (pyarrow.compute). RE2's \s, (?i) and $ differ
+# from Python's, so the whitespace set, the case folds of "https" (incl. the
+# long s) and "$ before a trailing newline" are written out explicitly.
+_RE2_SPACE = r'\t\n\x0b\f\r\x1c-\x1f \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}'
+_URL_RE2 = rf'^[hH][tT][tT][pP][sS\x{{17f}}]?://[^{_RE2_SPACE}/$.?#].[^{_RE2_SPACE}]*\n?$'
+
 def default_is_valid_url(url: str) -> bool:
-    if pd.isna(url) or not url.strip():
+    # NaN comes through as float, so the isinstance check covers it
+    if not isinstance(url, str) or not url:
         return False
-    return validators.url(url) == True
+    return _URL_RE.match(url) is not None
 
-def regex_is_valid_url(url: str, pattern: str) -> bool:
-    if pd.isna(url) or not url.strip():
-        return False
-    return bool(re.match(pattern, url.strip()))
+@functools.lru_cache(maxsize=64)
+def _compile(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
 
 ###############################################################################
 # FILE IO
 ###############################################################################
+class OutFmt(Enum):
+    """Output formats offered in the UI; the value is the file extension."""
+    CSV = ".csv"
+    XLSX = ".xlsx"
+
+def _to_csv(df: pd.DataFrame, output_path: str, header: bool, mode: str):
+    df.to_csv(output_path, index=False, header=header, mode=mode, encoding='utf-8-sig')
+
+def _to_excel(df: pd.DataFrame, output_path: str, header: bool, mode: str):
+    df.to_excel(output_path, index=False)
+
+# Output extension -> writer, built once at import
+_WRITERS = {
+    '.csv': _to_csv,
+    '.xlsx': _to_excel,
+    '.xls': _to_excel,
+}
+
 def write_file(df: pd.DataFrame, output_path: str, header: bool = True, mode: str = 'w'):
     ext = os.path.splitext(output_path)[1].lower()
-    if ext == '.csv':
-        df.to_csv(output_path, index=False, header=header, mode=mode, encoding='utf-8-sig')
-    elif ext in ['.xlsx', '.xls']:
-        df.to_excel(output_path, index=False)
-    else:
+    writer = _WRITERS.get(ext)
+    if writer is None:
         raise ValueError(f"Unsupported output file type: '{ext}'")
+    writer(df, output_path, header, mode)
+
+def read_csv_header(input_path: str) -> list[str]:
+    with open(input_path, 'r', newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+def chunked_csv_reader(input_path: str, columns=None, block_size: int = 1 << 24):
+    """
+    Streams a CSV through Arrow's multi-threaded parser, one record batch at a time.
+    Every column is read as text so later blocks can't break the types inferred
+    from the first one, and only `columns` (if given) are parsed at all.
+    Yields (batch, bytes_read) so callers can report progress without a prepass.
+    The streaming reader emits one batch per parsed block, so bytes_read is the
+    number of blocks consumed so far times block_size (the file position isn't
+    usable: the reader runs far ahead of the batches it has handed out).
+    The file is memory-mapped so Arrow reads it natively (no Python file object
+    or GIL on the read path) and the kernel's readahead keeps the parser fed.
+    """
+    header = read_csv_header(input_path)
+    include = [c for c in columns if c in header] if columns else []
+    with pa.memory_map(input_path, 'r') as handle:
+        reader = pacsv.open_csv(
+            handle,
+            read_options=pacsv.ReadOptions(block_size=block_size, use_threads=True),
+            # Quoted cells may contain line breaks, as pandas' parser allowed
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={c: pa.string() for c in header},
+                include_columns=include or None
+            )
+        )
+        n = 0
+        for n, batch in enumerate(reader, start=1):
+            yield batch, n * block_size
+        if n == 0:
+            # Header-only file: still hand out one empty batch so the output
+            # gets created with its header
+            yield pa.RecordBatch.from_pylist([], schema=reader.schema), block_size
+
+def _to_number(values: pd.Series) -> pd.Series:
+    try:
+        return pd.to_numeric(values)
+    except (ValueError, TypeError):
+        return values
 
-def chunked_csv_reader(input_path: str, chunksize: int = 50000, encoding="utf-8-sig"):
-    for chunk in pd.read_csv(input_path, chunksize=chunksize, encoding=encoding):
-        yield chunk
+def infer_numeric_columns(table: pa.Table) -> pd.DataFrame:
+    """
+    Converts text read by chunked_csv_reader to a DataFrame where every column
+    whose values all parse as numbers becomes numeric again (empty -> NaN), as
+    read_csv would have inferred it. Used before writing Excel cells.
+    """
+    return table.to_pandas().apply(_to_number)
 
 def read_preview_df(file_path: str, nrows: int = 5) -> pd.DataFrame:
     ext = os.path.splitext(file_path)[1].lower()
     if ext == '.csv':
         return pd.read_csv(file_path, nrows=nrows, encoding='utf-8-sig')
     elif ext in ['.xlsx', '.xls']:
-        return pd.read_excel(file_path, nrows=nrows)
+        return pd.read_excel(file_path, nrows=nrows, engine=EXCEL_ENGINE)
     else:
         raise ValueError(f"Unsupported file type for preview: {ext}")
 
 ###############################################################################
 # WORKER: Process a Single File
 ###############################################################################
-class CleanDataWorker(QObject):
+class CleanDataWorker:
     """
-    Processes a single file. We'll assign tasks from a queue to an available worker.
+    Processes a single file. Instances are plain (picklable) objects that run
+    inside a pool process and report back through a multiprocessing queue as
+    ("progress" | "finished" | "error", generation, rowIndex, value) tuples.
+    generation identifies the run (Start press) the worker belongs to.
     """
-    # progress(rowIndex, progressValue)
-    progress = pyqtSignal(int, int)
-    # finished(rowIndex, message)
-    finished = pyqtSignal(int, str)
-    # error(rowIndex, errorMessage)
-    error = pyqtSignal(int, str)
 
     def __init__(
         self,
@@ -149,9 +249,9 @@ class CleanDataWorker(QObject):
         columns_to_keep: list[str],
         columns_to_validate: list[str],
         use_custom_regex: bool,
-        custom_regex: str
+        custom_regex: str,
+        generation: int
     ):
-        super().__init__()
         self.row_index = row_index
         self.input_file = input_file
         self.output_file = output_file
@@ -159,81 +259,245 @@ class CleanDataWorker(QObject):
         self.columns_to_validate = columns_to_validate
         self.use_custom_regex = use_custom_regex
         self.custom_regex = custom_regex
-        self.stop_requested = False
+        self.generation = generation
+
+        # Set by run() inside the pool process
+        self._events = None
+        self._active_generation = None
+
+        # Resolve the input/output formats once; the chunk loop just calls self._write
+        self._in_ext = os.path.splitext(input_file)[1].lower()
+        self._out_ext = os.path.splitext(output_file)[1].lower()
+        self._fmt = OutFmt.CSV if self._out_ext == OutFmt.CSV.value else OutFmt.XLSX
+        self._write = {
+            OutFmt.CSV: self._write_csv_chunk,
+            OutFmt.XLSX: self._collect_excel_chunk,
+        }[self._fmt]
+
+        # Persistent Arrow writer for streamed CSV output (see _write_csv_chunk)
+        self._sink = None
+        self._writer = None
+        self._schema = None
+        # Excel files can't be appended to, so those chunks are written in one go at the end
+        self._excel_parts = []
+
+        # Kept/validated columns that actually exist; resolved from the first chunk
+        self._keep_cols = None
+        self._validate_cols = None
+        self._passthrough = False
+
+        # Compile once per worker; None means use the default validator
+        if use_custom_regex and custom_regex:
+            self._compiled = _compile(custom_regex)
+        else:
+            self._compiled = None
 
-    @pyqtSlot()
-    def run(self):
+        # Only the default check runs in Arrow compute (RE2), through a pattern
+        # kept equivalent to _URL_RE. User patterns always go through Python's
+        # re in _clean_df: RE2 would silently change what \w, \s, $ etc. mean.
+        self._arrow_pattern = _URL_RE2 if self._compiled is None else None
+
+    def run(self, events, active_generation):
+        self._events = events
+        self._active_generation = active_generation
         try:
             logging.info(f"Worker started for file: {self.input_file}")
-            ext = os.path.splitext(self.input_file)[1].lower()
-            if ext in ['.xlsx', '.xls']:
+            if self._in_ext in ['.xlsx', '.xls']:
                 self._process_excel()
-            elif ext == '.csv':
+            elif self._in_ext == '.csv':
                 self._process_csv()
             else:
-                raise ValueError(f"Unsupported file type: {ext}")
+                raise ValueError(f"Unsupported file type: {self._in_ext}")
 
             msg = f"Completed -> {self.output_file}"
             logging.info(msg)
-            self.finished.emit(self.row_index, msg)
+            events.put(("finished", self.generation, self.row_index, msg))
 
         except Exception as e:
             logging.error(f"Worker error on {self.input_file}: {str(e)}", exc_info=True)
-            self.error.emit(self.row_index, str(e))
+            events.put(("error", self.generation, self.row_index, str(e)))
+
+    @property
+    def stop_requested(self) -> bool:
+        # Stop All clears the active generation and Start moves it on, so a
+        # worker from an earlier run stays stopped even after a new Start
+        return (self._active_generation is not None
+                and self._active_generation.value != self.generation)
 
-    def stop(self):
-        self.stop_requested = True
+    def _emit_progress(self, val: int):
+        self._events.put(("progress", self.generation, self.row_index, val))
 
     def _process_excel(self):
-        df = pd.read_excel(self.input_file)
-        df_cleaned = self._clean_df(df)
+        df = pd.read_excel(self.input_file, engine=EXCEL_ENGINE)
+        # The read has no stop checks, so don't write if Stop came in meanwhile
+        if self.stop_requested:
+            raise Exception("Stopped by user")
+        self._resolve_columns(list(df.columns))
+        df_cleaned = df if self._passthrough else self._clean_df(df)
         write_file(df_cleaned, self.output_file)
-        self.progress.emit(self.row_index, 100)
+        self._emit_progress(100)
 
     def _process_csv(self):
-        # Count total rows (minus header)
-        with open(self.input_file, 'r', encoding='utf-8-sig') as f:
-            total_rows = sum(1 for _ in f) - 1
-        if total_rows < 1:
-            total_rows = 1
+        # Progress is based on bytes consumed, so no need to pre-count rows
+        total_bytes = max(os.path.getsize(self.input_file), 1)
+
+        try:
+            for batch, bytes_read in chunked_csv_reader(self.input_file, columns=self.columns_to_keep):
+                if self.stop_requested:
+                    raise Exception("Stopped by user")
 
-        chunksize = 20000
-        rows_processed = 0
-        first_chunk = True
+                logging.info(f"Processing chunk of size {batch.num_rows} from {self.input_file}")
+                if self._keep_cols is None:
+                    self._resolve_columns(batch.schema.names)
+
+                if self._passthrough:
+                    cleaned = batch
+                elif self._arrow_pattern is not None:
+                    cleaned = self._clean_batch(batch)
+                else:
+                    cleaned_df = self._clean_df(batch.to_pandas(types_mapper=pd.ArrowDtype))
+                    cleaned = pa.RecordBatch.from_pandas(cleaned_df, preserve_index=False)
+                self._write(cleaned)
+
+                # The last block is usually partial, so clamp
+                progress_val = min(int(bytes_read / total_bytes * 100), 100)
+                self._emit_progress(progress_val)
+        finally:
+            self._close_writer()
+
+        if self._excel_parts:
+            table = pa.Table.from_batches(self._excel_parts)
+            self._excel_parts = []
+            write_file(infer_numeric_columns(table), self.output_file)
+
+    def _write_csv_chunk(self, batch: pa.RecordBatch):
+        """
+        Appends a chunk through a single pyarrow CSVWriter. The file (and its
+        UTF-8 BOM + header) is created on the first chunk and reused after that.
+        """
+        if self._writer is None:
+            self._schema = batch.schema.remove_metadata()
+            self._sink = open(self.output_file, 'wb')
+            self._sink.write(b'\xef\xbb\xbf')
+            self._writer = pacsv.CSVWriter(self._sink, self._schema)
+        self._writer.write_batch(batch.cast(self._schema))
+
+    def _collect_excel_chunk(self, batch: pa.RecordBatch):
+        self._excel_parts.append(batch)
+
+    def _close_writer(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+    def _resolve_columns(self, names: list[str]):
+        """
+        Intersects the selected columns with the file's columns once, so the
+        per-chunk cleaners don't redo membership checks. With nothing to
+        validate and every column kept, chunks are passed through untouched.
+        """
+        self._keep_cols = [c for c in self.columns_to_keep if c in names]
+        self._validate_cols = [c for c in self.columns_to_validate if c in self._keep_cols]
+        self._passthrough = not self._validate_cols and self._keep_cols == list(names)
 
-        for chunk in chunked_csv_reader(self.input_file, chunksize=chunksize):
+    def _clean_batch(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """
+        Arrow counterpart of _clean_df for the default check: the URL checks run
+        as RE2 kernels over the column buffers and the batch is filtered once.
+        """
+        batch = batch.select(self._keep_cols)
+        if not self._validate_cols:
+            return batch
+
+        mask = None
+        for col in self._validate_cols:
+            col_mask = pc.match_substring_regex(batch.column(col), self._arrow_pattern)
+            mask = col_mask if mask is None else pc.and_(mask, col_mask)
             if self.stop_requested:
                 raise Exception("Stopped by user")
 
-            logging.info(f"Processing chunk of size {len(chunk)} from {self.input_file}")
-            cleaned = self._clean_df(chunk)
-            write_file(cleaned, self.output_file, header=first_chunk, mode='w' if first_chunk else 'a')
-            first_chunk = False
-
-            rows_processed += len(chunk)
-            progress_val = int(rows_processed / total_rows * 100)
-            self.progress.emit(self.row_index, progress_val)
+        return batch.filter(pc.fill_null(mask, False))
 
     def _clean_df(self, df: pd.DataFrame) -> pd.DataFrame:
-        actual_cols = [c for c in self.columns_to_keep if c in df.columns]
-        if not actual_cols:
+        if self._keep_cols is None:
+            self._resolve_columns(list(df.columns))
+        if not self._keep_cols:
             return pd.DataFrame()
+        if not self._validate_cols:
+            return df[self._keep_cols]
+
+        # Build one row mask and subset rows + columns in a single step
+        mask = np.ones(len(df), dtype=bool)
+
+        for col in self._validate_cols:
+            if self._compiled is not None:
+                # Strip the whole column once instead of per value
+                stripped = df[col].astype("string").str.strip()
+                # Match with Python's re: pandas' Arrow-backed .str.match would use RE2
+                match = self._compiled.match
+                values = stripped.to_numpy(dtype=object, na_value=None)
+                mask &= np.fromiter(
+                    (v is not None and match(v) is not None for v in values),
+                    dtype=bool, count=len(values)
+                )
+            else:
+                mask &= df[col].map(default_is_valid_url).to_numpy(dtype=bool)
+            if self.stop_requested:
+                raise Exception("Stopped by user")
 
-        df = df[actual_cols]
+        return df.loc[mask, self._keep_cols]
 
-        for col in self.columns_to_validate:
-            if col in df.columns:
-                df = df[df[col].apply(self._is_valid_wrapper)]
-                if self.stop_requested:
-                    raise Exception("Stopped by user")
+###############################################################################
+# PROCESS POOL
+###############################################################################
+# Set in each pool process by _init_pool_process
+_pool_events = None
+_pool_active_generation = None
 
-        return df
+def _init_pool_process(events, active_generation):
+    global _pool_events, _pool_active_generation
+    _pool_events = events
+    _pool_active_generation = active_generation
 
-    def _is_valid_wrapper(self, url: str) -> bool:
-        if self.use_custom_regex and self.custom_regex:
-            return regex_is_valid_url(url, self.custom_regex)
-        else:
-            return default_is_valid_url(url)
+def process_file(worker: CleanDataWorker):
+    """
+    Pool entry point. Runs in a separate interpreter, so pandas/regex work on
+    different files really runs in parallel instead of contending for the GIL.
+    """
+    worker.run(_pool_events, _pool_active_generation)
+
+class WorkerEventReader(QObject):
+    """
+    Lives in a QThread and drains the pool's event queue, re-emitting each
+    message as a Qt signal for the main window. A None message stops it.
+    """
+    # progress(generation, rowIndex, progressValue)
+    progress = pyqtSignal(int, int, int)
+    # finished(generation, rowIndex, message)
+    finished = pyqtSignal(int, int, str)
+    # error(generation, rowIndex, errorMessage)
+    error = pyqtSignal(int, int, str)
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    @pyqtSlot()
+    def run(self):
+        while True:
+            msg = self.events.get()
+            if msg is None:
+                break
+            kind, generation, row_index, value = msg
+            if kind == "progress":
+                self.progress.emit(generation, row_index, value)
+            elif kind == "finished":
+                self.finished.emit(generation, row_index, value)
+            else:
+                self.error.emit(generation, row_index, value)
 
 ###############################################################################
 # MAIN WINDOW
@@ -246,9 +510,38 @@ class CleanWebsiteApp(QMainWindow):
 
         # Data for concurrency
         self.tasks = []            # (row_index, input_file, output_file)
-        self.max_concurrency = self.config.get("numThreads", 4)
-        self.active_threads = []
-        self.workers = []
+        self.max_concurrency = self.config.get("numThreads", DEFAULT_WORKERS)
+        self.active_rows = set()
+        self.run_regex = ""
+        # True while the worker count is above the core count, so that is only warned about once
+        self._warned_worker_count = False
+
+        # Process pool + the queue/value shared with its processes.
+        # Spawn (not fork) so children never inherit Qt's threads.
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._pool = None
+        self._pool_size = 0
+        self._pool_broken = False   # set from the pool thread when a process dies
+        self._events = self._mp_context.Queue()
+        # Each Start press is a new generation. Workers run while the shared
+        # active generation matches theirs; 0 means nothing should run.
+        self._generation = 0
+        self._active_generation = self._mp_context.Value("i", 0)
+
+        # Single Qt thread turning queue messages into signals
+        self._event_reader = WorkerEventReader(self._events)
+        self._event_thread = QThread()
+        self._event_reader.moveToThread(self._event_thread)
+        self._event_thread.started.connect(self._event_reader.run)
+        self._event_reader.progress.connect(self.on_worker_progress)
+        self._event_reader.finished.connect(self.on_worker_finished)
+        self._event_reader.error.connect(self.on_worker_error)
+        self._event_thread.start()
+
+        # Progress updates are coalesced and flushed once per event-loop pass
+        self._last_progress = {}     # row -> value currently shown
+        self._pending_progress = {}  # row -> latest value not yet shown
+        self._progress_flush_scheduled = False
 
         # Output directory (could be stored in config)
         self.output_dir = self.config.get("outputDir", "")
@@ -308,9 +601,11 @@ class CleanWebsiteApp(QMainWindow):
         layout.addWidget(self.format_combo, 1, 3)
 
         # 6) Threads
-        layout.addWidget(QLabel("Number of Threads:"), 1, 4)
+        layout.addWidget(QLabel("Number of Workers:"), 1, 4)
         self.thread_spin = QSpinBox()
-        self.thread_spin.setRange(1, 16)
+        self.thread_spin.setRange(1, MAX_WORKERS)
+        self.thread_spin.setValue(DEFAULT_WORKERS)
+        self.thread_spin.editingFinished.connect(self.on_worker_count_changed)
         layout.addWidget(self.thread_spin, 1, 5)
 
         # 7) Regex
@@ -334,9 +629,10 @@ class CleanWebsiteApp(QMainWindow):
         status_group = QGroupBox("File Status")
         sg_layout = QVBoxLayout(status_group)
 
-        self.file_table = QTableWidget()
-        self.file_table.setColumnCount(4)
-        self.file_table.setHorizontalHeaderLabels(["File", "Progress", "Status", "Output File"])
+        self.file_model = QStandardItemModel(0, 4)
+        self.file_model.setHorizontalHeaderLabels(["File", "Progress", "Status", "Output File"])
+        self.file_table = QTableView()
+        self.file_table.setModel(self.file_model)
         self.file_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.file_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         sg_layout.addWidget(self.file_table)
@@ -403,10 +699,8 @@ class CleanWebsiteApp(QMainWindow):
             event.ignore()
 
     def dropEvent(self, event: QDropEvent):
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if os.path.isfile(file_path):
-                self.add_file_to_table(file_path)
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        self.add_files_to_table([p for p in paths if os.path.isfile(p)])
 
     ###########################################################################
     # SELECT OUTPUT DIRECTORY
@@ -430,16 +724,24 @@ class CleanWebsiteApp(QMainWindow):
         dialog.setNameFilters(["CSV Files (*.csv)", "Excel Files (*.xlsx *.xls)"])
         if dialog.exec():
             selected = dialog.selectedFiles()
-            for f in selected:
-                self.add_file_to_table(f)
+            self.add_files_to_table(selected)
 
-    def add_file_to_table(self, file_path: str):
-        row = self.file_table.rowCount()
-        self.file_table.insertRow(row)
-        self.file_table.setItem(row, 0, QTableWidgetItem(file_path))
-        self.file_table.setItem(row, 1, QTableWidgetItem("0%"))
-        self.file_table.setItem(row, 2, QTableWidgetItem("Pending"))
-        self.file_table.setItem(row, 3, QTableWidgetItem(""))  # Output file (empty for now)
+    def add_files_to_table(self, file_paths: list[str]):
+        """
+        Appends one model row per file. The view repaints once for the whole
+        batch instead of once per file.
+        """
+        self.file_table.setUpdatesEnabled(False)
+        try:
+            for file_path in file_paths:
+                self.file_model.appendRow([
+                    QStandardItem(file_path),
+                    QStandardItem("0%"),
+                    QStandardItem("Pending"),
+                    QStandardItem("")  # Output file (empty for now)
+                ])
+        finally:
+            self.file_table.setUpdatesEnabled(True)
 
     def remove_selected_files(self):
         """
@@ -448,19 +750,18 @@ class CleanWebsiteApp(QMainWindow):
         rows = self.file_table.selectionModel().selectedRows()
         # We should remove from bottom to top to avoid reindexing issues
         for r in sorted(rows, key=lambda x: x.row(), reverse=True):
-            self.file_table.removeRow(r.row())
+            self.file_model.removeRow(r.row())
 
     ###########################################################################
     # PREVIEW
     ###########################################################################
     def preview_selected_file(self):
-        row = self.file_table.currentRow()
+        row = self.file_table.currentIndex().row()
         if row < 0:
             return
-        item = self.file_table.item(row, 0)
-        if not item:
+        file_path = self.get_file_cell(row, 0).strip()
+        if not file_path:
             return
-        file_path = item.text().strip()
         self.load_preview(file_path)
 
     def load_preview(self, file_path: str):
@@ -478,10 +779,21 @@ class CleanWebsiteApp(QMainWindow):
         self.preview_table.setColumnCount(len(df.columns))
         self.preview_table.setHorizontalHeaderLabels(df.columns)
 
-        for r in range(len(df)):
-            for c in range(len(df.columns)):
-                val = df.iat[r, c]
-                self.preview_table.setItem(r, c, QTableWidgetItem(str(val) if pd.notna(val) else ""))
+        # Repaint once after all cells are set, not after each one
+        self.preview_table.setUpdatesEnabled(False)
+        self.preview_table.blockSignals(True)
+        try:
+            # One conversion up front instead of an indexer lookup per cell
+            values = df.to_numpy(dtype=object)
+            present = df.notna().to_numpy()
+            for r in range(values.shape[0]):
+                for c in range(values.shape[1]):
+                    text = str(values[r, c]) if present[r, c] else ""
+                    self.preview_table.setItem(r, c, QTableWidgetItem(text))
+        finally:
+            self.preview_table.blockSignals(False)
+            self.preview_table.setUpdatesEnabled(True)
+            self.preview_table.viewport().update()
 
     ###########################################################################
     # FUZZY COLUMN DETECTION
@@ -492,10 +804,25 @@ class CleanWebsiteApp(QMainWindow):
 
         col_list = list(columns)
 
-        title_keywords = ["title", "titel", "titulo", "заголовок", "titolo"]
-        web_keywords = ["website", "web", "url", "site", "homepage"]
+        if process is not None:
+            # fuzzy approach: score every column against every keyword in one call
+            scores = process.cdist(
+                [str(c).lower() for c in col_list],
+                FUZZY_KEYWORDS,
+                scorer=fuzz.partial_ratio,
+                workers=-1
+            )
+            n_title = len(TITLE_KEYWORDS)
+            web_hits = scores[:, n_title:].max(axis=1) > 70
+            keep_hits = (scores[:, :n_title].max(axis=1) > 70) | web_hits
+            validate_hits = web_hits
+        else:
+            # fallback substring check
+            lows = [str(c).lower() for c in col_list]
+            keep_hits = ["title" in low or "web" in low or "site" in low for low in lows]
+            validate_hits = ["web" in low or "url" in low or "site" in low for low in lows]
 
-        for col in col_list:
+        for i, col in enumerate(col_list):
             item_keep = QListWidgetItem(col)
             item_keep.setFlags(item_keep.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             item_keep.setCheckState(Qt.CheckState.Unchecked)
@@ -504,23 +831,10 @@ class CleanWebsiteApp(QMainWindow):
             item_val.setFlags(item_val.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             item_val.setCheckState(Qt.CheckState.Unchecked)
 
-            if process is not None:
-                # fuzzy approach
-                best_title = process.extractOne(col.lower(), title_keywords, scorer=fuzz.partial_ratio)
-                if best_title and best_title[1] > 70:
-                    item_keep.setCheckState(Qt.CheckState.Checked)
-
-                best_web = process.extractOne(col.lower(), web_keywords, scorer=fuzz.partial_ratio)
-                if best_web and best_web[1] > 70:
-                    item_keep.setCheckState(Qt.CheckState.Checked)
-                    item_val.setCheckState(Qt.CheckState.Checked)
-            else:
-                # fallback substring check
-                low = col.lower()
-                if "title" in low or "web" in low or "site" in low:
-                    item_keep.setCheckState(Qt.CheckState.Checked)
-                if "web" in low or "url" in low or "site" in low:
-                    item_val.setCheckState(Qt.CheckState.Checked)
+            if keep_hits[i]:
+                item_keep.setCheckState(Qt.CheckState.Checked)
+            if validate_hits[i]:
+                item_val.setCheckState(Qt.CheckState.Checked)
 
             self.keep_list.addItem(item_keep)
             self.validate_list.addItem(item_val)
@@ -529,7 +843,7 @@ class CleanWebsiteApp(QMainWindow):
     # START & STOP PROCESSING
     ###########################################################################
     def start_processing(self):
-        row_count = self.file_table.rowCount()
+        row_count = self.file_model.rowCount()
         if row_count == 0:
             QMessageBox.information(self, "No Files", "Please add files first.")
             return
@@ -541,9 +855,19 @@ class CleanWebsiteApp(QMainWindow):
         base_name = self.base_name_edit.text().strip()
         if not base_name:
             base_name = "cleaned_output"
-        out_format = self.format_combo.currentText()  # 'csv' or 'xlsx'
+        out_format = OutFmt("." + self.format_combo.currentText())  # 'csv' or 'xlsx'
         custom_regex = self.regex_edit.text().strip()
 
+        # Workers compile the regex on this thread, so reject bad patterns up front
+        if custom_regex:
+            try:
+                _compile(custom_regex)
+            except re.error as e:
+                QMessageBox.warning(self, "Invalid Regex", f"Custom regex is not valid: {e}")
+                return
+        # Tasks scheduled later in this run use the validated pattern, not live edits
+        self.run_regex = custom_regex
+
         # Save config
         self.config["lastRegex"] = custom_regex
         self.config["lastOutputBaseName"] = base_name
@@ -555,26 +879,33 @@ class CleanWebsiteApp(QMainWindow):
         columns_to_keep = self.get_checked_items(self.keep_list)
         columns_to_validate = self.get_checked_items(self.validate_list)
 
+        # New run: events from earlier workers are ignored from here on, and
+        # they no longer count against max_concurrency
+        self._generation += 1
+        self._active_generation.value = self._generation
+        self.active_rows.clear()
+
         # Reset table statuses
+        self._last_progress.clear()
+        self._pending_progress.clear()
         for r in range(row_count):
-            self.file_table.setItem(r, 1, QTableWidgetItem("0%"))
-            self.file_table.setItem(r, 2, QTableWidgetItem("Pending"))
-            self.file_table.setItem(r, 3, QTableWidgetItem(""))
+            self.set_file_cell(r, 1, "0%")
+            self.set_file_cell(r, 2, "Pending")
+            self.set_file_cell(r, 3, "")
 
         # Build queue
         self.tasks.clear()
         for r in range(row_count):
-            file_item = self.file_table.item(r, 0)
-            if not file_item:
+            file_in = self.get_file_cell(r, 0).strip()
+            if not file_in:
                 continue
-            file_in = file_item.text().strip()
             if not os.path.isfile(file_in):
-                self.file_table.setItem(r, 2, QTableWidgetItem("File Not Found"))
+                self.set_file_cell(r, 2, "File Not Found")
                 continue
 
             # Construct output file inside output_dir
             out_file = f"{base_name}_{os.path.splitext(os.path.basename(file_in))[0]}"
-            ext = ".csv" if out_format == "csv" else ".xlsx"
+            ext = out_format.value
             if not out_file.lower().endswith(ext):
                 out_file += ext
             full_out = os.path.join(self.output_dir, out_file)
@@ -582,22 +913,41 @@ class CleanWebsiteApp(QMainWindow):
             self.tasks.append((r, file_in, full_out))
 
         self.max_concurrency = self.thread_spin.value()
-        self.active_threads.clear()
-        self.workers.clear()
+        self.ensure_pool()
 
-        logging.info(f"Starting concurrency with up to {self.max_concurrency} threads.")
+        logging.info(f"Starting concurrency with up to {self.max_concurrency} processes.")
         self.schedule_next_tasks()
 
+    def ensure_pool(self, force: bool = False):
+        """
+        (Re)creates the process pool when none exists, the worker count changed,
+        or a pool process died (a broken pool rejects every new submit).
+        An old pool is shut down without waiting so running files can finish.
+        """
+        if (not force and not self._pool_broken and self._pool is not None
+                and self._pool_size == self.max_concurrency):
+            return
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_concurrency,
+            mp_context=self._mp_context,
+            initializer=_init_pool_process,
+            initargs=(self._events, self._active_generation)
+        )
+        self._pool_size = self.max_concurrency
+        self._pool_broken = False
+
     def schedule_next_tasks(self):
-        while len(self.active_threads) < self.max_concurrency and len(self.tasks) > 0:
+        while len(self.active_rows) < self.max_concurrency and len(self.tasks) > 0:
             r, in_file, out_file = self.tasks.pop(0)
 
-            self.file_table.setItem(r, 2, QTableWidgetItem("Processing"))
-            self.file_table.setItem(r, 3, QTableWidgetItem(out_file))
+            self.set_file_cell(r, 2, "Processing")
+            self.set_file_cell(r, 3, out_file)
 
             columns_to_keep = self.get_checked_items(self.keep_list)
             columns_to_validate = self.get_checked_items(self.validate_list)
-            custom_regex = self.regex_edit.text().strip()
+            custom_regex = self.run_regex
             use_custom_regex = bool(custom_regex)
 
             worker = CleanDataWorker(
@@ -607,26 +957,19 @@ class CleanWebsiteApp(QMainWindow):
                 columns_to_keep=columns_to_keep,
                 columns_to_validate=columns_to_validate,
                 use_custom_regex=use_custom_regex,
-                custom_regex=custom_regex
+                custom_regex=custom_regex,
+                generation=self._generation
+            )
+            self.active_rows.add(r)
+            try:
+                future = self._pool.submit(process_file, worker)
+            except BrokenProcessPool:
+                logging.error("Process pool is broken, starting a new one.")
+                self.ensure_pool(force=True)
+                future = self._pool.submit(process_file, worker)
+            future.add_done_callback(
+                lambda f, row=r, gen=self._generation: self.on_future_done(gen, row, f)
             )
-            thread = QThread()
-            worker.moveToThread(thread)
-
-            # Connect signals
-            thread.started.connect(worker.run)
-            worker.progress.connect(self.on_worker_progress)
-            worker.finished.connect(self.on_worker_finished)
-            worker.error.connect(self.on_worker_error)
-
-            # Cleanup
-            worker.finished.connect(lambda row, msg, t=thread: self.on_thread_complete(t))
-            worker.error.connect(lambda row, msg, t=thread: self.on_thread_complete(t))
-            worker.finished.connect(thread.quit)
-            worker.error.connect(thread.quit)
-
-            self.active_threads.append(thread)
-            self.workers.append(worker)
-            thread.start()
 
     def stop_all(self):
         """
@@ -634,30 +977,74 @@ class CleanWebsiteApp(QMainWindow):
         """
         logging.info("Stop requested for all workers.")
         self.tasks.clear()  # no more tasks
-        for w in self.workers:
-            w.stop()
+        self._active_generation.value = 0
 
     ###########################################################################
     # THREAD SIGNALS
     ###########################################################################
-    @pyqtSlot(int, int)
-    def on_worker_progress(self, row_index: int, val: int):
-        self.file_table.setItem(row_index, 1, QTableWidgetItem(f"{val}%"))
-
-    @pyqtSlot(int, str)
-    def on_worker_finished(self, row_index: int, message: str):
-        self.file_table.setItem(row_index, 1, QTableWidgetItem("100%"))
-        self.file_table.setItem(row_index, 2, QTableWidgetItem("Completed"))
+    @pyqtSlot(int, int, int)
+    def on_worker_progress(self, generation: int, row_index: int, val: int):
+        if generation != self._generation or self._last_progress.get(row_index) == val:
+            return
+        self._pending_progress[row_index] = val
+        if not self._progress_flush_scheduled:
+            self._progress_flush_scheduled = True
+            QTimer.singleShot(0, self.flush_progress)
+
+    def flush_progress(self):
+        """
+        Writes all progress values received since the last flush in one
+        batch, so a burst of chunk updates only repaints the table once.
+        """
+        self._progress_flush_scheduled = False
+        if not self._pending_progress:
+            return
+        self.file_table.setUpdatesEnabled(False)
+        try:
+            for row_index, val in self._pending_progress.items():
+                self.set_file_cell(row_index, 1, f"{val}%")
+                self._last_progress[row_index] = val
+        finally:
+            self._pending_progress.clear()
+            self.file_table.setUpdatesEnabled(True)
+
+    @pyqtSlot(int, int, str)
+    def on_worker_finished(self, generation: int, row_index: int, message: str):
+        # A worker from an earlier run must not touch a row the current run owns
+        if generation != self._generation:
+            return
+        # Drop any pending progress so it can't overwrite the final 100%
+        self._pending_progress.pop(row_index, None)
+        self.set_file_cell(row_index, 1, "100%")
+        self.set_file_cell(row_index, 2, "Completed")
         logging.info(f"Worker finished: Row {row_index}, {message}")
+        self.on_task_complete(row_index)
 
-    @pyqtSlot(int, str)
-    def on_worker_error(self, row_index: int, error_msg: str):
-        self.file_table.setItem(row_index, 2, QTableWidgetItem(f"Error: {error_msg}"))
+    @pyqtSlot(int, int, str)
+    def on_worker_error(self, generation: int, row_index: int, error_msg: str):
+        if generation != self._generation:
+            return
+        self._pending_progress.pop(row_index, None)
+        self.set_file_cell(row_index, 2, f"Error: {error_msg}")
         logging.error(f"Worker error row {row_index}: {error_msg}")
+        self.on_task_complete(row_index)
 
-    def on_thread_complete(self, thread: QThread):
-        if thread in self.active_threads:
-            self.active_threads.remove(thread)
+    def on_future_done(self, generation: int, row_index: int, future):
+        """
+        Runs on the pool's management thread. Workers report their own result
+        through the queue; this only covers failures that never reached run()
+        (e.g. a crashed pool process).
+        """
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if isinstance(exc, BrokenProcessPool):
+            self._pool_broken = True
+        if exc is not None:
+            self._events.put(("error", generation, row_index, str(exc) or type(exc).__name__))
+
+    def on_task_complete(self, row_index: int):
+        self.active_rows.discard(row_index)
         self.schedule_next_tasks()
 
     ###########################################################################
@@ -667,14 +1054,11 @@ class CleanWebsiteApp(QMainWindow):
         """
         Opens the output file of the currently selected row, if any.
         """
-        row = self.file_table.currentRow()
+        row = self.file_table.currentIndex().row()
         if row < 0:
             return
-        out_item = self.file_table.item(row, 3)
-        if not out_item:
-            return
 
-        output_path = out_item.text().strip()
+        output_path = self.get_file_cell(row, 3).strip()
         if not output_path or not os.path.isfile(output_path):
             QMessageBox.warning(self, "Open Output", "Output file not found or doesn't exist yet.")
             return
@@ -695,6 +1079,13 @@ class CleanWebsiteApp(QMainWindow):
     ###########################################################################
     # HELPER METHODS
     ###########################################################################
+    def get_file_cell(self, row: int, col: int) -> str:
+        item = self.file_model.item(row, col)
+        return item.text() if item else ""
+
+    def set_file_cell(self, row: int, col: int, text: str):
+        self.file_model.setData(self.file_model.index(row, col), text)
+
     def get_checked_items(self, list_widget: QListWidget) -> list[str]:
         result = []
         for i in range(list_widget.count()):
@@ -708,8 +1099,10 @@ class CleanWebsiteApp(QMainWindow):
         self.regex_edit.setText(rx)
         bn = self.config.get("lastOutputBaseName", "cleaned_output")
         self.base_name_edit.setText(bn)
-        threads = self.config.get("numThreads", 4)
+        threads = self.config.get("numThreads", DEFAULT_WORKERS)
         self.thread_spin.setValue(threads)
+        # A saved count above the cores was the user's choice; only warn on a new crossing
+        self._warned_worker_count = self.thread_spin.value() > CPU_COUNT
 
         self.output_dir = self.config.get("outputDir", "")
         if self.output_dir:
@@ -738,8 +1131,34 @@ class CleanWebsiteApp(QMainWindow):
             self.config["theme"] = "Light"
 
         save_config(self.config)
+
+        self._active_generation.value = 0
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        self._events.put(None)
+        self._event_thread.quit()
+        self._event_thread.wait()
+
         super().closeEvent(event)
 
+    ###########################################################################
+    # WORKER COUNT
+    ###########################################################################
+    def on_worker_count_changed(self):
+        # editingFinished fires on every focus-out/Enter, so only warn when the
+        # value crosses above the core count, not again while it stays there
+        count = self.thread_spin.value()
+        above = count > CPU_COUNT
+        crossed = above and not self._warned_worker_count
+        self._warned_worker_count = above
+        if crossed:
+            QMessageBox.warning(
+                self,
+                "Number of Workers",
+                f"{count} workers is more than the {CPU_COUNT} CPU cores on this machine. "
+                "Extra workers will compete for the same cores and usually slow processing down."
+            )
+
     ###########################################################################
     # THEME SWITCHING
     ###########################################################################
@@ -758,7 +1177,7 @@ class CleanWebsiteApp(QMainWindow):
                 background-color: #2f2f2f;
                 color: #dddddd;
             }
-            QLineEdit, QTableWidget, QListWidget, QComboBox, QSpinBox {
+            QLineEdit, QTableView, QListWidget, QComboBox, QSpinBox {
                 background-color: #3f3f3f;
                 color: #ffffff;
             }
@@ -782,7 +1201,7 @@ class CleanWebsiteApp(QMainWindow):
                 background-color: black;
                 color: yellow;
             }
-            QLineEdit, QTableWidget, QListWidget, QComboBox, QSpinBox {
+            QLineEdit, QTableView, QListWidget, QComboBox, QSpinBox {
                 background-color: black;
                 color: yellow;
             }
@@ -806,6 +1225,7 @@ class CleanWebsiteApp(QMainWindow):
 # MAIN
 ###############################################################################
 def main():
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = CleanWebsiteApp()
     window.show()